@@ -459,7 +459,9 @@ class KeywordSearchResponse(AbstractResponse, EntryFetcher):
         hit from ElasticSearch
         :return: A HitEntry Object with the appropriate fields mapped
         """
-        self.logger.debug('Entry to be mapped: \n{}'.format(json_pp(entry)))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                'Entry to be mapped: \n{}'.format(json_pp(entry)))
         mapped_entry = HitEntry(
             _id=self.fetch_entry_value(mapping, entry, 'id'),
             objectID=self.fetch_entry_value(mapping, entry, 'objectID'),
@@ -495,7 +497,9 @@ class KeywordSearchResponse(AbstractResponse, EntryFetcher):
         # wrapped under anything
         super(KeywordSearchResponse, self).__init__()
         self.logger.info('Mapping the entries')
-        self.logger.debug('Mapping config: \n{}'.format(json_pp(mapping)))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                'Mapping config: \n{}'.format(json_pp(mapping)))
         class_entries = {'hits': [self.map_entries(mapping, x) for x in hits],
                          'pagination': None}
         self.apiResponse = ApiResponse(**class_entries)
@@ -586,7 +590,9 @@ class AutoCompleteResponse(EntryFetcher):
         the entry
         :return: A HitEntry Object with the appropriate fields mapped
         """
-        self.logger.debug("Entry to be mapped: \n{}".format(json_pp(entry)))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Entry to be mapped: \n{}".format(json_pp(entry)))
         mapped_entry = {}
         if _type == 'file':
             # Create a file representation
@@ -624,7 +630,8 @@ class AutoCompleteResponse(EntryFetcher):
         # Overriding the __init__ method of the parent class
         EntryFetcher.__init__(self)
         self.logger.info("Mapping entries")
-        self.logger.debug("Mapping: \n{}".format(json_pp(mapping)))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Mapping: \n{}".format(json_pp(mapping)))
         class_entries = {'hits': [self.map_entries(
             mapping, x, _type) for x in hits], 'pagination': None}
         self.apiResponse = AutoCompleteRepresentation(**class_entries)